@@ -1,5 +1,20 @@
 """Speech-to-IPA prototype package."""
 
-__all__ = ["transcribe_audio_to_ipa", "TranscriptionResult", "SegmentResult"]
+__all__ = [
+    "transcribe_audio_to_ipa",
+    "transcribe_files_to_ipa",
+    "stream_transcribe_audio_to_ipa",
+    "TranscriptionResult",
+    "SegmentResult",
+]
 
-from .pipeline import transcribe_audio_to_ipa, TranscriptionResult, SegmentResult
+
+def __getattr__(name):
+    # PEP 562: defer importing the pipeline (which pulls in faster_whisper
+    # and phonemizer) until one of the public names is actually used, so
+    # `import speechtoipa` stays cheap.
+    if name in __all__:
+        from . import pipeline
+
+        return getattr(pipeline, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import argparse
+import json
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
-from .pipeline import TranscriptionResult, transcribe_audio_to_ipa
+if TYPE_CHECKING:
+    from .pipeline import SegmentResult, TranscriptionResult
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -14,7 +16,15 @@ def _build_parser() -> argparse.ArgumentParser:
             "Transcribe an audio file with faster-whisper and convert the transcript to IPA using espeak-ng."
         )
     )
-    parser.add_argument("audio", type=Path, help="Path to the input audio file (any ffmpeg-compatible format).")
+    parser.add_argument(
+        "audio",
+        type=Path,
+        nargs="+",
+        help=(
+            "Path(s) to input audio files (any ffmpeg-compatible format). With several "
+            "files the model is loaded once and shared across all of them."
+        ),
+    )
     parser.add_argument(
         "--model",
         default="small",
@@ -38,11 +48,50 @@ def _build_parser() -> argparse.ArgumentParser:
         "--compute-type",
         help="Override faster-whisper compute type (e.g. int8, float16, float32). Auto-selected by default.",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=8,
+        help="Number of VAD chunks decoded per batch. Use 1 to fall back to sequential decoding.",
+    )
+    parser.add_argument(
+        "--phonemize-jobs",
+        type=int,
+        help=(
+            "Number of parallel phonemization jobs (defaults to half the CPU cores). "
+            "Not used with --segments, which phonemizes each segment as it streams."
+        ),
+    )
+    parser.add_argument(
+        "--backend",
+        default="phonemizer",
+        choices=["phonemizer", "espeak-daemon"],
+        help=(
+            "Phonemization backend: the phonemizer library (default) or a warm "
+            "espeak-ng subprocess (faster, but without phonemizer's punctuation handling)."
+        ),
+    )
+    parser.add_argument(
+        "--rephonemize-full",
+        action="store_true",
+        help="Phonemize the concatenated transcript in an extra pass instead of joining per-segment IPA.",
+    )
     parser.add_argument(
         "--disable-vad",
         action="store_true",
         help="Disable the built-in voice-activity detector (keep long silences).",
     )
+    parser.add_argument(
+        "--vad-threshold",
+        type=float,
+        help="Silero VAD speech probability threshold, 0-1 (default 0.5).",
+    )
+    parser.add_argument(
+        "--min-silence",
+        type=int,
+        metavar="MS",
+        help="Milliseconds of silence that end a speech chunk (default 500).",
+    )
     parser.add_argument(
         "--output",
         type=Path,
@@ -61,11 +110,22 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _format_summary(result: TranscriptionResult, *, color: bool, segments: bool) -> str:
+def _style(text: str, code: str, *, color: bool) -> str:
+    if not color:
+        return text
+    return f"\033[{code}m{text}\033[0m"
+
+
+def _format_segment(seg: SegmentResult, *, color: bool) -> str:
+    return (
+        f"[{seg.start:6.2f}s – {seg.end:6.2f}s] {seg.text}\n"
+        f"    {_style(seg.ipa, '36', color=color)}"
+    )
+
+
+def _format_summary(result: TranscriptionResult, *, color: bool) -> str:
     def style(text: str, code: str) -> str:
-        if not color:
-            return text
-        return f"\033[{code}m{text}\033[0m"
+        return _style(text, code, color=color)
 
     if result.language_confidence is None:
         confidence_str = "n/a"
@@ -87,14 +147,6 @@ def _format_summary(result: TranscriptionResult, *, color: bool, segments: bool)
         result.ipa or "<empty>",
     ]
 
-    if segments and result.segments:
-        lines.append("")
-        lines.append(style("Segments:", "1;37"))
-        for seg in result.segments:
-            lines.append(
-                f"[{seg.start:6.2f}s – {seg.end:6.2f}s] {seg.text}\n    {style(seg.ipa, '36')}"
-            )
-
     return "\n".join(lines)
 
 
@@ -102,20 +154,79 @@ def run_cli(argv: Optional[Iterable[str]] = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
 
-    result = transcribe_audio_to_ipa(
-        args.audio,
+    # Imported only after argument parsing so `--help` never pays the
+    # faster_whisper/phonemizer import cost.
+    from .pipeline import (
+        _DEFAULT_VAD_PARAMETERS,
+        TranscriptionResult,
+        stream_transcribe_audio_to_ipa,
+        transcribe_audio_to_ipa,
+        transcribe_files_to_ipa,
+    )
+
+    vad_parameters = None
+    if args.vad_threshold is not None or args.min_silence is not None:
+        vad_parameters = dict(_DEFAULT_VAD_PARAMETERS)
+        if args.vad_threshold is not None:
+            vad_parameters["threshold"] = args.vad_threshold
+        if args.min_silence is not None:
+            vad_parameters["min_silence_duration_ms"] = args.min_silence
+
+    color = not args.no_color
+
+    common_kwargs = dict(
         model_size=args.model,
         language=args.language,
         ipa_language=args.ipa_language,
         device=args.device,
         compute_type=args.compute_type,
         vad_filter=not args.disable_vad,
+        vad_parameters=vad_parameters,
+        batch_size=args.batch_size,
+        phonemize_backend=args.backend,
+        rephonemize_full=args.rephonemize_full,
     )
 
+    if len(args.audio) > 1:
+        results = transcribe_files_to_ipa(
+            args.audio, phonemize_jobs=args.phonemize_jobs, **common_kwargs
+        )
+        if args.output:
+            payload = [result.to_dict() for result in results]
+            args.output.write_text(
+                json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8"
+            )
+        for result in results:
+            print(_format_summary(result, color=color))
+            if args.segments and result.segments:
+                print(_style("Segments:", "1;37", color=color))
+                for seg in result.segments:
+                    print(_format_segment(seg, color=color))
+            print()
+        return 0
+
+    audio = args.audio[0]
+    if args.segments:
+        # Stream so each segment prints as soon as it is phonemized, instead
+        # of everything appearing only after the whole file is processed.
+        result: Optional[TranscriptionResult] = None
+        print(_style("Segments:", "1;37", color=color))
+        for item in stream_transcribe_audio_to_ipa(audio, **common_kwargs):
+            if isinstance(item, TranscriptionResult):
+                result = item
+            else:
+                print(_format_segment(item, color=color), flush=True)
+        assert result is not None
+        print()
+    else:
+        result = transcribe_audio_to_ipa(
+            audio, phonemize_jobs=args.phonemize_jobs, **common_kwargs
+        )
+
     if args.output:
         args.output.write_text(result.to_json(indent=2), encoding="utf-8")
 
-    summary = _format_summary(result, color=not args.no_color, segments=args.segments)
+    summary = _format_summary(result, color=color)
     print(summary)
 
     return 0
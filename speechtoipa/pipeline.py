@@ -2,21 +2,37 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict
+import os
+import select
+import stat
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from faster_whisper import WhisperModel
-from phonemizer import phonemize
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+from phonemizer.backend import EspeakBackend
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup only
+    orjson = None
 
 __all__ = [
     "SegmentResult",
     "TranscriptionResult",
+    "stream_transcribe_audio_to_ipa",
     "transcribe_audio_to_ipa",
+    "transcribe_files_to_ipa",
 ]
 
 # Minimal mapping between Whisper language hints and espeak-ng codes.
-_ESPEAK_LANG_MAP = {
+# Frozen so concurrent readers (server/batch use) can never observe a mutation.
+_ESPEAK_LANG_MAP = MappingProxyType({
     "af": "af",
     "ar": "ar",
     "bn": "bn",
@@ -57,15 +73,32 @@ _ESPEAK_LANG_MAP = {
     "zh": "zh",
     "zh-cn": "zh",
     "zh-tw": "zh",
-}
+})
 
 _PUNCTUATION = ";:,.!?¡¿—…\"«»“”()[]{}"
 
+# Below this many texts the fork overhead of parallel phonemization outweighs
+# the speedup, so the batch is phonemized on a single job regardless.
+_MIN_TEXTS_FOR_PARALLEL = 4
+
+# Tighter than Silero's stock settings: speech chunks end after 500 ms of
+# silence instead of 2 s and are padded less, so long pauses stop costing
+# decode cycles. Discarded sub-250 ms blips were producing empty segments
+# the pipeline threw away anyway.
+_DEFAULT_VAD_PARAMETERS = MappingProxyType({
+    "threshold": 0.5,
+    "min_speech_duration_ms": 250,
+    "min_silence_duration_ms": 500,
+    "speech_pad_ms": 200,
+})
+
 
 def _normalise_lang_code(code: Optional[str]) -> Optional[str]:
     if code is None:
         return None
-    return code.lower().strip().replace("_", "-")
+    # Interning collapses the transient strings the normalisation allocates:
+    # repeat requests for the same language share one canonical object.
+    return sys.intern(code.lower().strip().replace("_", "-"))
 
 
 def _resolve_espeak_language(language_hint: Optional[str]) -> str:
@@ -74,23 +107,18 @@ def _resolve_espeak_language(language_hint: Optional[str]) -> str:
         return "en-us"
 
     normalised = _normalise_lang_code(language_hint)
-    if not normalised:
-        return "en-us"
-
-    if normalised in _ESPEAK_LANG_MAP:
-        return _ESPEAK_LANG_MAP[normalised]
-
-    # Try stripping regional subtags (e.g., "pt-br" -> "pt").
-    if "-" in normalised:
-        base = normalised.split("-", 1)[0]
-        if base in _ESPEAK_LANG_MAP:
-            return _ESPEAK_LANG_MAP[base]
-
-    # Fall back to the normalised hint itself. espeak-ng is permissive with many aliases.
-    return normalised
+    # One .get() cascade: exact hit, then the bare base tag (e.g. "pt-br" ->
+    # "pt"), then the normalised hint itself -- espeak-ng is permissive with
+    # many aliases -- and finally the default for hints that normalise away.
+    return (
+        _ESPEAK_LANG_MAP.get(normalised)
+        or _ESPEAK_LANG_MAP.get(normalised.split("-", 1)[0])
+        or normalised
+        or "en-us"
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class SegmentResult:
     """Stores the timing, recognised text, and IPA for a single segment."""
 
@@ -102,10 +130,19 @@ class SegmentResult:
     no_speech_prob: Optional[float] = None
 
     def to_dict(self) -> dict:
-        return asdict(self)
-
-
-@dataclass
+        # Hand-rolled instead of dataclasses.asdict, which walks the fields
+        # reflectively and deep-copies every value.
+        return {
+            "start": self.start,
+            "end": self.end,
+            "text": self.text,
+            "ipa": self.ipa,
+            "avg_logprob": self.avg_logprob,
+            "no_speech_prob": self.no_speech_prob,
+        }
+
+
+@dataclass(slots=True)
 class TranscriptionResult:
     """Complete transcription result including segments and metadata."""
 
@@ -120,28 +157,211 @@ class TranscriptionResult:
     ipa_language: str
 
     def to_dict(self) -> dict:
-        payload = asdict(self)
-        payload["audio_path"] = str(self.audio_path)
-        payload["segments"] = [segment.to_dict() for segment in self.segments]
-        return payload
+        return {
+            "audio_path": str(self.audio_path),
+            "text": self.text,
+            "ipa": self.ipa,
+            "segments": [segment.to_dict() for segment in self.segments],
+            "language": self.language,
+            "language_confidence": self.language_confidence,
+            "duration": self.duration,
+            "model_size": self.model_size,
+            "ipa_language": self.ipa_language,
+        }
 
     def to_json(self, *, indent: int = 2) -> str:
+        # orjson serializes the UTF-8-heavy IPA payload several times faster
+        # than stdlib json, but only knows two-space indentation.
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode(
+                "utf-8"
+            )
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
 
-def _phonemize_text(text: str, ipa_language: str) -> str:
-    if not text.strip():
-        return ""
+@lru_cache(maxsize=4)
+def _get_model(model_size: str, device: str, compute_type: str) -> WhisperModel:
+    """Loads a WhisperModel once per (size, device, compute type) and keeps it resident."""
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+class _EspeakDaemon:
+    """Keeps one warm espeak-ng subprocess per language and streams text through it.
+
+    The phonemizer library re-enters the espeak backend per call and layers
+    Python-side post-processing on top; this talks to a single long-lived
+    ``espeak-ng -q --ipa`` process over pipes instead. Responses are framed
+    with a sentinel utterance because espeak emits one output line per clause,
+    so a single input line can produce several output lines.
+    """
+
+    # Pronounceable nonsense word; its rendering depends on the voice, so the
+    # actual marker line is calibrated once at startup.
+    _SENTINEL = "kawotubeska"
+
+    # Generous per-line ceiling: espeak renders a clause in well under a
+    # second, so hitting this means the process is wedged or block-buffering
+    # its output, and we fail instead of hanging forever on the pipe.
+    _READ_TIMEOUT = 10.0
+
+    def __init__(self, language: str):
+        self.language = language
+        try:
+            self._process = subprocess.Popen(
+                ["espeak-ng", "-q", "--ipa", "-v", language],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        except OSError as exc:
+            raise RuntimeError(
+                "Failed to start espeak-ng. Ensure the espeak-ng binary is "
+                f"installed and the language '{language}' is supported."
+            ) from exc
+        self._pending = b""
+        try:
+            self._marker = self._read_response([self._SENTINEL])[-1]
+        except RuntimeError:
+            # Calibration failed; do not leak the half-initialised process.
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Kills and reaps the subprocess; the daemon is unusable afterwards."""
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.wait()
+        # Reaping does not release our ends of the pipes; close them so an
+        # evicted daemon does not strand file descriptors until GC. Closing
+        # stdin flushes, which hits EPIPE when the process is already dead.
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        self._process.stdout.close()
+
+    def _read_line(self) -> str:
+        """Reads one output line straight off the pipe, with a timeout.
+
+        Raw fd reads rather than the buffered file object, so select() can
+        never be fooled by data hidden in a userspace buffer.
+        """
+        stdout_fd = self._process.stdout.fileno()
+        while b"\n" not in self._pending:
+            ready, _, _ = select.select([stdout_fd], [], [], self._READ_TIMEOUT)
+            if not ready:
+                raise RuntimeError(
+                    f"espeak-ng daemon for '{self.language}' produced no output "
+                    f"within {self._READ_TIMEOUT:g}s"
+                )
+            chunk = os.read(stdout_fd, 4096)
+            if not chunk:
+                raise RuntimeError(
+                    f"espeak-ng daemon for '{self.language}' exited unexpectedly"
+                )
+            self._pending += chunk
+        line, _, self._pending = self._pending.partition(b"\n")
+        return line.decode("utf-8", errors="replace").strip()
+
+    def _read_response(self, lines: List[str], until: Optional[str] = None) -> List[str]:
+        """Writes ``lines`` to the daemon and reads output lines until ``until``.
+
+        With ``until=None`` exactly one output line per input line is read,
+        which is only valid for single-clause input such as the sentinel.
+        """
+        assert self._process.stdin is not None and self._process.stdout is not None
+        try:
+            self._process.stdin.write(
+                "".join(line + "\n" for line in lines).encode("utf-8")
+            )
+            self._process.stdin.flush()
+        except OSError as exc:
+            raise RuntimeError(
+                f"espeak-ng daemon for '{self.language}' exited unexpectedly"
+            ) from exc
+
+        received: List[str] = []
+        while True:
+            stripped = self._read_line()
+            if until is None:
+                if stripped:
+                    received.append(stripped)
+                if len(received) == len(lines):
+                    return received
+            elif stripped == until:
+                return received
+            elif stripped:
+                received.append(stripped)
+
+    def phonemize(self, texts: List[str]) -> List[str]:
+        """Phonemizes ``texts`` through the warm subprocess, one result per text."""
+        results = []
+        for text in texts:
+            clause_lines = self._read_response(
+                [text.replace("\n", " "), self._SENTINEL], until=self._marker
+            )
+            results.append(" ".join(clause_lines))
+        return results
+
+
+# Plain dict rather than lru_cache so one language's daemon can be evicted
+# (and its process reaped) when it fails, without touching the others.
+_ESPEAK_DAEMONS: Dict[str, _EspeakDaemon] = {}
+
+
+def _get_espeak_daemon(ipa_language: str) -> _EspeakDaemon:
+    """Returns the warm daemon for ``ipa_language``, spawning it on first use."""
+    daemon = _ESPEAK_DAEMONS.get(ipa_language)
+    if daemon is None:
+        daemon = _ESPEAK_DAEMONS[ipa_language] = _EspeakDaemon(ipa_language)
+    return daemon
+
+
+def _discard_espeak_daemon(ipa_language: str) -> None:
+    """Drops a failed daemon and reaps its process; the next call respawns it."""
+    daemon = _ESPEAK_DAEMONS.pop(ipa_language, None)
+    if daemon is not None:
+        daemon.close()
+
+
+@lru_cache(maxsize=8)
+def _get_espeak_backend(ipa_language: str) -> EspeakBackend:
+    """Builds a persistent espeak backend for ``ipa_language``, cached per language."""
+    return EspeakBackend(
+        ipa_language,
+        punctuation_marks=_PUNCTUATION,
+        preserve_punctuation=True,
+        with_stress=True,
+    )
+
+
+def _phonemize_batch(
+    texts: List[str],
+    ipa_language: str,
+    *,
+    njobs: int = 1,
+    backend: str = "phonemizer",
+) -> List[str]:
+    """Phonemizes ``texts`` in a single espeak backend invocation."""
+    if not texts:
+        return []
+
+    if backend == "espeak-daemon":
+        daemon = _get_espeak_daemon(ipa_language)
+        try:
+            return daemon.phonemize(texts)
+        except RuntimeError:
+            # Do not keep serving a daemon whose process has died; evict and
+            # reap only this language so the next call spawns a fresh one and
+            # other languages' daemons stay warm.
+            _discard_espeak_daemon(ipa_language)
+            raise
+
+    if len(texts) < _MIN_TEXTS_FOR_PARALLEL:
+        njobs = 1
 
     try:
-        return phonemize(
-            text,
-            language=ipa_language,
-            backend="espeak",
-            strip=True,
-            preserve_punctuation=True,
-            with_stress=True,
-            punctuation_marks=_PUNCTUATION,
+        return _get_espeak_backend(ipa_language).phonemize(
+            texts, strip=True, njobs=njobs
         )
     except RuntimeError as exc:
         raise RuntimeError(
@@ -150,69 +370,366 @@ def _phonemize_text(text: str, ipa_language: str) -> str:
         ) from exc
 
 
-def transcribe_audio_to_ipa(
+def _stat_audio_file(path: Path) -> os.stat_result:
+    """Stats ``path`` once, rejecting anything that is not a regular file.
+
+    One syscall instead of the two a ``Path.exists()`` pre-check costs, and
+    unlike ``exists()`` it does not let directories through to the decoder.
+    """
+    try:
+        result = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Audio file not found: {path}") from None
+    if not stat.S_ISREG(result.st_mode):
+        raise FileNotFoundError(f"Audio file not found: {path}")
+    return result
+
+
+def _start_transcription(
     audio_path: Path | str,
     *,
-    model_size: str = "small",
-    language: Optional[str] = None,
-    ipa_language: Optional[str] = None,
-    device: str = "cpu",
-    compute_type: Optional[str] = None,
-    vad_filter: bool = True,
-) -> TranscriptionResult:
-    """Transcribes ``audio_path`` and returns IPA-rich metadata."""
+    model_size: str,
+    language: Optional[str],
+    ipa_language: Optional[str],
+    device: str,
+    compute_type: Optional[str],
+    vad_filter: bool,
+    vad_parameters: Optional[dict],
+    condition_on_previous_text: bool,
+    chunk_length: int,
+    batch_size: int,
+    phonemize_backend: str,
+) -> Tuple[Path, Iterator, object, str, str]:
+    """Validates inputs, loads the model, and kicks off (lazy) decoding."""
 
     resolved_audio_path = Path(audio_path)
-    if not resolved_audio_path.exists():
-        raise FileNotFoundError(f"Audio file not found: {resolved_audio_path}")
+    _stat_audio_file(resolved_audio_path)
 
     if compute_type is None:
-        compute_type = "int8" if device == "cpu" else "auto"
+        # On CUDA, int8-quantized weights with float16 activations halve the
+        # memory traffic of the bandwidth-bound decoder versus the float16
+        # that "auto" picks, with negligible accuracy cost.
+        compute_type = "int8" if device == "cpu" else "int8_float16"
+
+    if phonemize_backend not in ("phonemizer", "espeak-daemon"):
+        raise ValueError(f"Unknown phonemize backend: {phonemize_backend!r}")
 
-    model = WhisperModel(model_size, device=device, compute_type=compute_type)
-    segments_iter, info = model.transcribe(
-        str(resolved_audio_path),
+    if vad_parameters is None:
+        vad_parameters = dict(_DEFAULT_VAD_PARAMETERS)
+
+    model = _get_model(model_size, device, compute_type)
+    transcribe_kwargs = dict(
         language=language,
         beam_size=1,
         best_of=1,
         vad_filter=vad_filter,
+        vad_parameters=vad_parameters,
         temperature=0.0,
+        # Off by default: conditioning chains each window on the previous
+        # one, which serializes decoding and defeats batched parallelism.
+        condition_on_previous_text=condition_on_previous_text,
+        # Pack VAD chunks up to the full Whisper window to cut segment count.
+        chunk_length=chunk_length,
     )
+    # Decode to a 16 kHz mono float32 waveform up front rather than handing
+    # the path to transcribe: one PyAV decode total, and the waveform is the
+    # form the batched pipeline prefers.
+    audio = decode_audio(str(resolved_audio_path), sampling_rate=16000)
+
+    if batch_size > 1 and vad_filter:
+        # Batched decoding groups VAD chunks so the model processes several at
+        # once instead of one segment per forward pass. It has nothing to
+        # batch without VAD chunks (faster-whisper raises), so vad_filter
+        # False always takes the sequential path below.
+        pipeline = BatchedInferencePipeline(model=model)
+        segments_iter, info = pipeline.transcribe(
+            audio, batch_size=batch_size, **transcribe_kwargs
+        )
+    else:
+        segments_iter, info = model.transcribe(audio, **transcribe_kwargs)
 
     recognised_language = language or info.language or ""
     ipa_code = ipa_language or _resolve_espeak_language(recognised_language)
+    return resolved_audio_path, segments_iter, info, recognised_language, ipa_code
+
+
+def _finalize_result(
+    resolved_audio_path: Path,
+    segments: List[SegmentResult],
+    full_text_parts: List[str],
+    segment_ipas: List[str],
+    info: object,
+    recognised_language: str,
+    ipa_code: str,
+    model_size: str,
+    rephonemize_full: bool,
+    phonemize_backend: str,
+) -> TranscriptionResult:
+    """Assembles the aggregate transcript/IPA and the final result object."""
+
+    # Every part is already stripped (and espeak output is strip=True'd), so a
+    # single join suffices; re-stripping the result would only rescan it.
+    full_text = " ".join(full_text_parts)
+    if rephonemize_full and full_text:
+        # Extra espeak pass over the whole transcript; only differs from the
+        # join at segment boundaries (cross-segment sandhi).
+        full_ipa = _phonemize_batch([full_text], ipa_code, backend=phonemize_backend)[0]
+    else:
+        # A segment's text can phonemize to nothing (e.g. Whisper's "♪" music
+        # markers); skip those so the join never emits double or trailing
+        # spaces.
+        full_ipa = " ".join(ipa for ipa in segment_ipas if ipa)
+
+    return TranscriptionResult(
+        audio_path=resolved_audio_path,
+        text=full_text,
+        ipa=full_ipa,
+        segments=segments,
+        language=recognised_language,
+        language_confidence=getattr(info, "language_probability", None),
+        duration=getattr(info, "duration", None),
+        model_size=model_size,
+        ipa_language=ipa_code,
+    )
+
+
+def stream_transcribe_audio_to_ipa(
+    audio_path: Path | str,
+    *,
+    model_size: str = "small",
+    language: Optional[str] = None,
+    ipa_language: Optional[str] = None,
+    device: str = "cpu",
+    compute_type: Optional[str] = None,
+    vad_filter: bool = True,
+    vad_parameters: Optional[dict] = None,
+    condition_on_previous_text: bool = False,
+    chunk_length: int = 30,
+    batch_size: int = 8,
+    phonemize_backend: str = "phonemizer",
+    rephonemize_full: bool = False,
+) -> Iterator[Union[SegmentResult, TranscriptionResult]]:
+    """Yields each ``SegmentResult`` as soon as its segment is phonemized.
+
+    The final item is the aggregate ``TranscriptionResult``, so first output
+    arrives after the first decoded segment instead of after the whole file.
+    Segments are phonemized one at a time as they stream out of the decoder,
+    which is why there is no ``phonemize_jobs`` here.
+    """
+
+    resolved_audio_path, segments_iter, info, recognised_language, ipa_code = (
+        _start_transcription(
+            audio_path,
+            model_size=model_size,
+            language=language,
+            ipa_language=ipa_language,
+            device=device,
+            compute_type=compute_type,
+            vad_filter=vad_filter,
+            vad_parameters=vad_parameters,
+            condition_on_previous_text=condition_on_previous_text,
+            chunk_length=chunk_length,
+            batch_size=batch_size,
+            phonemize_backend=phonemize_backend,
+        )
+    )
 
     segments: List[SegmentResult] = []
     full_text_parts: List[str] = []
+    segment_ipas: List[str] = []
 
     for segment in segments_iter:
         segment_text = segment.text.strip()
         if not segment_text:
             continue
+        segment_ipa = _phonemize_batch(
+            [segment_text], ipa_code, backend=phonemize_backend
+        )[0]
+        segment_result = SegmentResult(
+            start=segment.start,
+            end=segment.end,
+            text=segment_text,
+            ipa=segment_ipa,
+            # faster-whisper's Segment always carries these fields, so the
+            # defensive getattr per segment was pure overhead.
+            avg_logprob=segment.avg_logprob,
+            no_speech_prob=segment.no_speech_prob,
+        )
+        segments.append(segment_result)
         full_text_parts.append(segment_text)
-        segment_ipa = _phonemize_text(segment_text, ipa_code)
-        segments.append(
-            SegmentResult(
-                start=segment.start,
-                end=segment.end,
-                text=segment_text,
-                ipa=segment_ipa,
-                avg_logprob=getattr(segment, "avg_logprob", None),
-                no_speech_prob=getattr(segment, "no_speech_prob", None),
-            )
+        segment_ipas.append(segment_ipa)
+        yield segment_result
+
+    yield _finalize_result(
+        resolved_audio_path,
+        segments,
+        full_text_parts,
+        segment_ipas,
+        info,
+        recognised_language,
+        ipa_code,
+        model_size,
+        rephonemize_full,
+        phonemize_backend,
+    )
+
+
+def transcribe_audio_to_ipa(
+    audio_path: Path | str,
+    *,
+    model_size: str = "small",
+    language: Optional[str] = None,
+    ipa_language: Optional[str] = None,
+    device: str = "cpu",
+    compute_type: Optional[str] = None,
+    vad_filter: bool = True,
+    vad_parameters: Optional[dict] = None,
+    condition_on_previous_text: bool = False,
+    chunk_length: int = 30,
+    batch_size: int = 8,
+    phonemize_jobs: Optional[int] = None,
+    phonemize_backend: str = "phonemizer",
+    rephonemize_full: bool = False,
+) -> TranscriptionResult:
+    """Transcribes ``audio_path`` and returns IPA-rich metadata."""
+
+    if phonemize_jobs is None:
+        phonemize_jobs = (os.cpu_count() or 2) // 2
+    phonemize_jobs = max(1, phonemize_jobs)
+
+    resolved_audio_path, segments_iter, info, recognised_language, ipa_code = (
+        _start_transcription(
+            audio_path,
+            model_size=model_size,
+            language=language,
+            ipa_language=ipa_language,
+            device=device,
+            compute_type=compute_type,
+            vad_filter=vad_filter,
+            vad_parameters=vad_parameters,
+            condition_on_previous_text=condition_on_previous_text,
+            chunk_length=chunk_length,
+            batch_size=batch_size,
+            phonemize_backend=phonemize_backend,
         )
+    )
 
-    full_text = " ".join(full_text_parts).strip()
-    full_ipa = _phonemize_text(full_text, ipa_code) if full_text else ""
+    raw_segments = []
+    full_text_parts: List[str] = []
 
-    return TranscriptionResult(
-        audio_path=resolved_audio_path,
-        text=full_text,
-        ipa=full_ipa,
-        segments=segments,
-        language=recognised_language,
-        language_confidence=getattr(info, "language_probability", None),
-        duration=getattr(info, "duration", None),
-        model_size=model_size,
-        ipa_language=ipa_code,
+    if phonemize_jobs == 1:
+        # ``segments_iter`` yields lazily as the model decodes, so hand each
+        # segment to a worker thread and phonemize it while the next segment
+        # is still being decoded. A single worker is deliberate: the espeak
+        # wrapper is an in-process library and is not safe to call from
+        # several threads at once.
+        ipa_futures = []
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            for segment in segments_iter:
+                segment_text = segment.text.strip()
+                if not segment_text:
+                    continue
+                full_text_parts.append(segment_text)
+                raw_segments.append(segment)
+                ipa_futures.append(
+                    pool.submit(
+                        _phonemize_batch,
+                        [segment_text],
+                        ipa_code,
+                        backend=phonemize_backend,
+                    )
+                )
+        segment_ipas = [future.result()[0] for future in ipa_futures]
+    else:
+        # Parallel phonemization needs the whole batch up front, so collect
+        # every segment first and run one backend invocation over all of them;
+        # joining the per-segment IPA also spares a second pass over the full
+        # text.
+        for segment in segments_iter:
+            segment_text = segment.text.strip()
+            if not segment_text:
+                continue
+            full_text_parts.append(segment_text)
+            raw_segments.append(segment)
+        segment_ipas = _phonemize_batch(
+            full_text_parts, ipa_code, njobs=phonemize_jobs, backend=phonemize_backend
+        )
+    segments = [
+        SegmentResult(
+            start=segment.start,
+            end=segment.end,
+            text=segment_text,
+            ipa=segment_ipa,
+            # faster-whisper's Segment always carries these fields, so the
+            # defensive getattr per segment was pure overhead.
+            avg_logprob=segment.avg_logprob,
+            no_speech_prob=segment.no_speech_prob,
+        )
+        for segment, segment_text, segment_ipa in zip(
+            raw_segments, full_text_parts, segment_ipas
+        )
+    ]
+
+    return _finalize_result(
+        resolved_audio_path,
+        segments,
+        full_text_parts,
+        segment_ipas,
+        info,
+        recognised_language,
+        ipa_code,
+        model_size,
+        rephonemize_full,
+        phonemize_backend,
     )
+
+
+def transcribe_files_to_ipa(
+    paths: Iterable[Path | str],
+    *,
+    model_size: str = "small",
+    language: Optional[str] = None,
+    ipa_language: Optional[str] = None,
+    device: str = "cpu",
+    compute_type: Optional[str] = None,
+    vad_filter: bool = True,
+    vad_parameters: Optional[dict] = None,
+    condition_on_previous_text: bool = False,
+    chunk_length: int = 30,
+    batch_size: int = 8,
+    phonemize_jobs: Optional[int] = None,
+    phonemize_backend: str = "phonemizer",
+    rephonemize_full: bool = False,
+) -> List[TranscriptionResult]:
+    """Transcribes several files with one resident model, preserving input order.
+
+    Files are processed shortest-first (on-disk size as a cheap proxy for
+    duration) so similarly long audios go through the batched pipeline back to
+    back, while the returned list still matches the order of ``paths``. Model
+    and phonemizer backends are shared across files via the module caches, so
+    only the first file pays the load cost.
+    """
+
+    resolved = [Path(path) for path in paths]
+    sizes = [_stat_audio_file(path).st_size for path in resolved]
+    order = sorted(range(len(resolved)), key=sizes.__getitem__)
+
+    results: List[Optional[TranscriptionResult]] = [None] * len(resolved)
+    for index in order:
+        results[index] = transcribe_audio_to_ipa(
+            resolved[index],
+            model_size=model_size,
+            language=language,
+            ipa_language=ipa_language,
+            device=device,
+            compute_type=compute_type,
+            vad_filter=vad_filter,
+            vad_parameters=vad_parameters,
+            condition_on_previous_text=condition_on_previous_text,
+            chunk_length=chunk_length,
+            batch_size=batch_size,
+            phonemize_jobs=phonemize_jobs,
+            phonemize_backend=phonemize_backend,
+            rephonemize_full=rephonemize_full,
+        )
+    return results
@@ -0,0 +1,86 @@
+"""Protocol tests for the espeak-ng daemon backend.
+
+The real espeak-ng binary is not assumed to be installed; these tests drive
+the pipe protocol against scripted stand-ins that reproduce the behaviors the
+protocol has to survive: one output line per clause, a child that never
+flushes its output, and a child that dies mid-stream.
+"""
+import os
+import sys
+import textwrap
+
+import pytest
+
+from speechtoipa import pipeline
+
+# Emits one marked line per sentence-ish clause, flushing like espeak-ng does
+# when it writes a clause; exercises the sentinel framing.
+_CLAUSE_STUB = """
+import sys
+for line in sys.stdin:
+    for clause in line.split("."):
+        clause = clause.strip()
+        if clause:
+            print("<%s>" % clause, flush=True)
+"""
+
+# Never produces output, like a child whose stdout is block-buffered (or that
+# is wedged); the daemon must time out instead of hanging in readline.
+_SILENT_STUB = """
+import time
+time.sleep(60)
+"""
+
+
+def _install_stub(tmp_path, monkeypatch, body):
+    script = tmp_path / "espeak-ng"
+    script.write_text(f"#!{sys.executable}\n{textwrap.dedent(body)}")
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+
+@pytest.fixture(autouse=True)
+def _reap_daemons():
+    yield
+    for language in list(pipeline._ESPEAK_DAEMONS):
+        pipeline._discard_espeak_daemon(language)
+
+
+def test_sentinel_framing_joins_clause_lines(tmp_path, monkeypatch):
+    _install_stub(tmp_path, monkeypatch, _CLAUSE_STUB)
+    daemon = pipeline._get_espeak_daemon("en-us")
+    assert daemon.phonemize(["hello there. general kenobi", "bye"]) == [
+        "<hello there> <general kenobi>",
+        "<bye>",
+    ]
+
+
+def test_block_buffered_child_times_out_instead_of_hanging(tmp_path, monkeypatch):
+    _install_stub(tmp_path, monkeypatch, _SILENT_STUB)
+    monkeypatch.setattr(pipeline._EspeakDaemon, "_READ_TIMEOUT", 0.2)
+    with pytest.raises(RuntimeError, match="produced no output"):
+        pipeline._get_espeak_daemon("en-us")
+    # The failed calibration must not leave the daemon registered or running.
+    assert "en-us" not in pipeline._ESPEAK_DAEMONS
+
+
+def test_dead_daemon_evicted_without_touching_other_languages(tmp_path, monkeypatch):
+    _install_stub(tmp_path, monkeypatch, _CLAUSE_STUB)
+    dead = pipeline._get_espeak_daemon("en-us")
+    survivor = pipeline._get_espeak_daemon("de")
+
+    dead._process.kill()
+    dead._process.wait()
+    with pytest.raises(RuntimeError):
+        pipeline._phonemize_batch(["x"], "en-us", backend="espeak-daemon")
+
+    # Only the failed language was evicted; the other daemon is still warm.
+    assert "en-us" not in pipeline._ESPEAK_DAEMONS
+    assert pipeline._ESPEAK_DAEMONS["de"] is survivor
+    assert survivor._process.poll() is None
+    assert pipeline._phonemize_batch(["x"], "de", backend="espeak-daemon") == ["<x>"]
+
+    # The next call for the failed language respawns a fresh daemon.
+    fresh = pipeline._get_espeak_daemon("en-us")
+    assert fresh is not dead
+    assert fresh.phonemize(["y"]) == ["<y>"]